@@ -1019,8 +1019,7 @@ class ComicTranslate(ComicTranslateUI):
         self.save_main_page_settings()
         
         # Delete temp archive folders
-        for archive in self.file_handler.archive_info:
-            shutil.rmtree(archive['temp_dir'])
+        self.file_handler.cleanup()
 
         super().closeEvent(event)
 
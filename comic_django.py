@@ -63,6 +63,8 @@ class Manhwa:
 
 
 class ManhwaFileHandler(FileHandler):
+    __slots__ = ()
+
     def sanitize_and_copy_files(self, file_paths):
         return file_paths
 
@@ -95,14 +97,13 @@ class ManhwaPipeline(ComicTranslatePipeline):
             target_lang_en = self.main_page.lang_mapping.get(target_lang, None)
             trg_lng_cd = get_language_code(target_lang_en)
             
-            base_name = os.path.splitext(os.path.basename(image_path))[0]
-            extension = os.path.splitext(image_path)[1]
-            directory = os.path.dirname(image_path)
+            directory, file_name = os.path.split(image_path)
+            base_name, extension = os.path.splitext(file_name)
 
             archive_bname = ""
             for archive in self.main_page.file_handler.archive_info:
-                images = archive['extracted_images']
-                archive_path = archive['archive_path']
+                images = archive.extracted_images
+                archive_path = archive.archive_path
 
                 for img_pth in images:
                     if img_pth == image_path:
@@ -211,14 +212,14 @@ class ManhwaPipeline(ComicTranslatePipeline):
                 path = os.path.join(directory, f"comic_translate_{timestamp}", "raw_texts", archive_bname)
                 if not os.path.exists(path):
                     os.makedirs(path, exist_ok=True)
-                file = open(os.path.join(path, os.path.splitext(os.path.basename(image_path))[0] + "_raw.txt"), 'w', encoding='UTF-8')
+                file = open(os.path.join(path, f"{base_name}_raw.txt"), 'w', encoding='UTF-8')
                 file.write(entire_raw_text)
 
             if export_settings['export_translated_text']:
                 path = os.path.join(directory, f"comic_translate_{timestamp}", "translated_texts", archive_bname)
                 if not os.path.exists(path):
                     os.makedirs(path, exist_ok=True)
-                file = open(os.path.join(path, os.path.splitext(os.path.basename(image_path))[0] + "_translated.txt"), 'w', encoding='UTF-8')
+                file = open(os.path.join(path, f"{base_name}_translated.txt"), 'w', encoding='UTF-8')
                 file.write(entire_translated_text)
 
             self.main_page.progress_update.emit(index, total_images, 7, 10, False)
@@ -270,7 +271,7 @@ class ManhwaPipeline(ComicTranslatePipeline):
                     self.main_page.current_worker = None
                     break
 
-                archive_path = archive['archive_path']
+                archive_path = archive.archive_path
                 archive_ext = os.path.splitext(archive_path)[1]
                 archive_bname = os.path.splitext(os.path.basename(archive_path))[0]
                 archive_directory = os.path.dirname(archive_path)
@@ -286,7 +287,7 @@ class ManhwaPipeline(ComicTranslatePipeline):
 
                 # Create the new archive
                 output_base_name = f"{archive_bname}"
-                target_lang = self.main_page.image_states[archive['extracted_images'][0]]['target_lang']
+                target_lang = self.main_page.image_states[archive.extracted_images[0]]['target_lang']
                 target_lang_en = self.main_page.lang_mapping.get(target_lang, target_lang)
                 trg_lng_code = get_language_code(target_lang_en)
                 make(save_as_ext=save_as_ext, input_dir=save_dir, 
@@ -300,7 +301,7 @@ class ManhwaPipeline(ComicTranslatePipeline):
 
                 # Clean up temporary directories
                 shutil.rmtree(save_dir)
-                shutil.rmtree(archive['temp_dir'])
+                shutil.rmtree(archive.temp_dir)
 
                 if is_directory_empty(check_from):
                     shutil.rmtree(check_from)
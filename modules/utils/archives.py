@@ -5,35 +5,41 @@ import img2pdf
 from ebooklib import epub
 import pymupdf
 
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.webp'})
+
 def is_image_file(filename):
-    image_extensions = ('.jpg', '.jpeg', '.png', '.bmp', '.webp')
-    return filename.lower().endswith(image_extensions)
+    return os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS
 
-def extract_archive(file_path, extract_to):
+def extract_archive(file_path, extract_to, member_filter=is_image_file):
+    """Extract only the members accepted by member_filter and return their paths."""
     image_paths = []
 
     if file_path.lower().endswith(('.cbz', '.zip', '.epub')):
         archive = zipfile.ZipFile(file_path, 'r')
-        archive.extractall(extract_to)
-        image_paths = [os.path.join(extract_to, file) for file in archive.namelist() if is_image_file(file) and 'cover' not in file.lower()]
+        members = [file for file in archive.namelist() if member_filter(file) and 'cover' not in file.lower()]
+        archive.extractall(extract_to, members=members)
+        image_paths = [os.path.join(extract_to, file) for file in members]
         archive.close()
 
     elif file_path.lower().endswith('.cbr'):
         archive = rarfile.RarFile(file_path, 'r')
-        archive.extractall(extract_to)
-        image_paths = [os.path.join(extract_to, file) for file in archive.namelist() if is_image_file(file)]
+        members = [file for file in archive.namelist() if member_filter(file)]
+        archive.extractall(extract_to, members=members)
+        image_paths = [os.path.join(extract_to, file) for file in members]
         archive.close()
 
     elif file_path.lower().endswith('.cbt'):
         archive = tarfile.open(file_path, 'r')
-        archive.extractall(extract_to)
-        image_paths = [os.path.join(extract_to, file.name) for file in archive.getmembers() if file.isfile() and is_image_file(file.name)]
+        members = [file for file in archive.getmembers() if file.isfile() and member_filter(file.name)]
+        archive.extractall(extract_to, members=members)
+        image_paths = [os.path.join(extract_to, file.name) for file in members]
         archive.close()
 
     elif file_path.lower().endswith('.cb7'):
         with py7zr.SevenZipFile(file_path, 'r') as archive:
-            archive.extractall(extract_to)
-            image_paths = [os.path.join(extract_to, entry) for entry in archive.getnames() if is_image_file(entry)]
+            members = [entry for entry in archive.getnames() if member_filter(entry)]
+            archive.extract(extract_to, targets=members)
+            image_paths = [os.path.join(extract_to, entry) for entry in members]
 
     elif file_path.lower().endswith('.pdf'):
         pdf_file = pymupdf.open(file_path)
@@ -51,6 +57,9 @@ def extract_archive(file_path, extract_to):
                 image_bytes = base_image["image"]
                 image_ext = base_image["ext"]
                 image_filename = f"{index:0{digits}d}.{image_ext}"
+                # Embedded images can be in formats we can't load (e.g. jpx, jb2)
+                if not member_filter(image_filename):
+                    continue
                 image_path = os.path.join(extract_to, image_filename)
                 with open(image_path, "wb") as image_file:
                     image_file.write(image_bytes)
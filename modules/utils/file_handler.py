@@ -1,61 +1,139 @@
+import itertools
 import os
+import re
 import shutil
 import tempfile
 import string
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List
 from .archives import extract_archive
 
+_NON_PRINTABLE_RE = re.compile(f"[^{re.escape(string.printable)}]")
+_ARCHIVE_EXTS = frozenset({'.cbr', '.cbz', '.zip', '.cbt', '.cb7', '.pdf', '.epub'})
+
+ArchiveInfo = namedtuple('ArchiveInfo', 'archive_path extracted_images temp_dir')
+
+def _copy_file(src, dst):
+    """Copy file contents only (no permission bits), in kernel space where possible."""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        # Early EOF: unsupported here or the source changed
+                        raise OSError("copy_file_range stopped before the end of the file")
+                    remaining -= copied
+            return
+        except OSError:
+            # Unsupported by the filesystem or kernel, or cut short; redo it below
+            pass
+    shutil.copyfile(src, dst)
+
+def _copy_or_keep(src, dst):
+    """Copy src to dst and return dst, or return src unchanged if the copy fails."""
+    try:
+        _copy_file(src, dst)
+        return dst
+    except IOError as e:
+        print(f"An error occurred while copying or deleting the file: {e}")
+        return src
+
 class FileHandler:
+    __slots__ = ('file_paths', 'archive_info', 'temp_dir', '_archive_counter')
+
     def __init__(self):
         self.file_paths = []
         self.archive_info = []
+        # Single parent directory (under the system temp dir) holding one
+        # sub-directory per extracted archive, removed in cleanup()
+        self.temp_dir = None
+        self._archive_counter = itertools.count()
     
     def prepare_files(self):
+        if not self.file_paths:
+            return self.file_paths
+
+        results = list(self.file_paths)
+        archive_indices = [i for i, path in enumerate(results)
+                           if os.path.splitext(path)[1].lower() in _ARCHIVE_EXTS]
+
+        # Archives are independent of each other, so extraction and sanitization
+        # run concurrently. Each archive writes only into its own temp directory.
+        if archive_indices:
+            if self.temp_dir is None or not os.path.isdir(self.temp_dir):
+                self.temp_dir = tempfile.mkdtemp(prefix='comic_translate_')
+
+            max_workers = min(8, len(archive_indices))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._extract, results[i]) for i in archive_indices]
+                for i, future in zip(archive_indices, futures):
+                    results[i] = future.result()
+
+        # Loose images are sanitized together, as one list, so each copy is named
+        # after its position in the batch and can't collide with another page
+        loose_indices = [i for i, result in enumerate(results) if not isinstance(result, ArchiveInfo)]
+        loose_paths = [results[i] for i in loose_indices]
+        if not all(path.isascii() for path in loose_paths):
+            sanitized = self.sanitize_and_copy_files(loose_paths)
+            for i, sanitized_path in zip(loose_indices, sanitized):
+                results[i] = sanitized_path
+
         all_image_paths = []
-        
-        for path in self.file_paths:
-            if path.lower().endswith(('.cbr', '.cbz', '.zip', '.cbt', '.cb7', '.pdf', '.epub')):
-                print('Extracting archive:', path)
-                archive_dir = os.path.dirname(path)
-                temp_dir = tempfile.mkdtemp(dir=archive_dir)
-                
-                extracted_files = extract_archive(path, temp_dir)
-                image_paths = [f for f in extracted_files if f.lower().endswith(('.jpg', '.jpeg', '.png', '.webp', '.bmp'))]
-                image_paths = self.sanitize_and_copy_files(image_paths)
-                
-                all_image_paths.extend(image_paths)               
-                self.archive_info.append({
-                    'archive_path': path,
-                    'extracted_images': image_paths,
-                    'temp_dir': temp_dir
-                })
+        for result in results:
+            if isinstance(result, ArchiveInfo):
+                all_image_paths.extend(result.extracted_images)
+                self.archive_info.append(result)
             else:
-                path = self.sanitize_and_copy_files([path])[0]
-                all_image_paths.append(path)
+                all_image_paths.append(result)
         
         self.file_paths = all_image_paths
         return self.file_paths
 
+    def _extract(self, path):
+        print('Extracting archive:', path)
+        temp_dir = os.path.join(self.temp_dir, f"archive_{next(self._archive_counter)}")
+        os.mkdir(temp_dir)
+        
+        # Non-image members (metadata, fonts, html) are never written to disk
+        image_paths = extract_archive(path, temp_dir)
+        # Pass the full list so copies are named after their page position;
+        # sanitize_and_copy_files leaves the ASCII paths untouched
+        if not all(f.isascii() for f in image_paths):
+            image_paths = self.sanitize_and_copy_files(image_paths)
+        
+        return ArchiveInfo(path, image_paths, temp_dir)
+
+    def cleanup(self):
+        if self.temp_dir is not None:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+
     def sanitize_and_copy_files(self, file_paths):
-        sanitized_paths = []
+        sanitized_paths = list(file_paths)
+        indices, sources, targets = [], [], []
+        created_dirs = set()
         for index, image_path in enumerate(file_paths):
             if not image_path.isascii():
-                name = ''.join(c for c in image_path if c in string.printable)
-                dir_name = ''.join(c for c in os.path.dirname(image_path) if c in string.printable)
-                os.makedirs(dir_name, exist_ok=True)
-                if os.path.splitext(os.path.basename(name))[1] == '':
-                    basename = ""
-                    ext = os.path.splitext(os.path.basename(name))[0]
-                else:
-                    basename = os.path.splitext(os.path.basename(name))[0]
-                    ext = os.path.splitext(os.path.basename(name))[1]
-                sanitized_path = os.path.join(dir_name, basename + str(index) + ext)
-                try:
-                    shutil.copy(image_path, sanitized_path)
-                    image_path = sanitized_path
-                except IOError as e:
-                    print(f"An error occurred while copying or deleting the file: {e}")
-            sanitized_paths.append(image_path)
+                dir_name, tail = os.path.split(_NON_PRINTABLE_RE.sub('', image_path))
+                if dir_name not in created_dirs:
+                    os.makedirs(dir_name, exist_ok=True)
+                    created_dirs.add(dir_name)
+                stem, ext = os.path.splitext(tail)
+                if not ext:
+                    stem, ext = '', stem
+                indices.append(index)
+                sources.append(image_path)
+                targets.append(os.path.join(dir_name, f"{stem}{index}{ext}"))
+
+        if indices:
+            # Copies are independent and mostly wait on the kernel, so overlap them
+            with ThreadPoolExecutor(max_workers=min(4, len(indices))) as executor:
+                copied = executor.map(_copy_or_keep, sources, targets)
+                for index, image_path in zip(indices, copied):
+                    sanitized_paths[index] = image_path
 
         return sanitized_paths
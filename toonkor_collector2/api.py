@@ -78,23 +78,38 @@ def database_chapters_to_list(chapters_db: dict):
 
 
 def update_cached_chapter(toonkor_id: str, chapter_index: int, key: str, value) -> bool:
+    return update_cached_chapters(toonkor_id, [(chapter_index, key, value)])
+
+
+def update_cached_chapters(toonkor_id: str, updates: list[tuple[int, str, object]]) -> bool:
+    """Apply several (chapter_index, key, value) updates to a cached Manhwa in one go."""
+    if not updates:
+        return True
+
     try:
         if not cached_manhwas.get(toonkor_id):
             get_manhwa_details(toonkor_id)
         
         cached_chapters = cached_manhwas[toonkor_id]['chapters']
-
-        if isinstance(cached_chapters, dict):
-            if chapter_index in cached_chapters:
-                cached_chapters[chapter_index][key] = value
-                    
-        elif isinstance(cached_chapters, list):
-            cached_chapters[chapter_index][key] = value
-
-        return True
     except Exception as e:
         print(e)
         return False
+
+    # Each update fails on its own so one bad index doesn't drop the rest
+    success = True
+    for chapter_index, key, value in updates:
+        try:
+            if isinstance(cached_chapters, dict):
+                if chapter_index in cached_chapters:
+                    cached_chapters[chapter_index][key] = value
+
+            elif isinstance(cached_chapters, list):
+                cached_chapters[chapter_index][key] = value
+        except Exception as e:
+            print(e)
+            success = False
+
+    return success
                             
 
 def update_manhwa_from_mangadex(manhwa: dict, manhwa_db: Manhwa | None):
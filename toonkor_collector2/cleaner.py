@@ -5,6 +5,7 @@ from asgiref.sync import sync_to_async
 from toonkor_collector2.api import update_cached_chapter
 from collections import deque
 from channels.layers import get_channel_layer
+from toonkor_collector2.events import progress_event
 from toonkor_collector2.models import Chapter
 
 
@@ -51,18 +52,14 @@ class Cleaner:
             chapter['translation_status'] = "NOT_READY"
             update_cached_chapter(manhwa_id, chapter['index'], "translation_status", "NOT_READY")
             
-        await sync_to_async(chapter_obj.save)()
+        await sync_to_async(chapter_obj.save)(update_fields=['download_status', 'translation_status'])
         await self._send_progress(group_name, [chapter], {})
 
     async def _send_progress(self, group_name, chapters, progress):
         """Send progress updates to the WebSocket group."""
         await self._channel_layer.group_send(
             group_name,
-            {
-                "type": "send_progress",
-                "chapters": chapters,
-                "progress": progress,
-            }
+            progress_event(chapters=chapters, progress=progress),
         )
 
 
@@ -1,12 +1,13 @@
 import asyncio
-import json
 
+import orjson
 from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 from toonkor_collector2.cleaner import cleaner
 from toonkor_collector2.downloader import downloader
+from toonkor_collector2.events import progress_event
 from toonkor_collector2.models import Chapter, StatusChoices, encode_name
-from toonkor_collector2.api import update_cached_chapter
+from toonkor_collector2.api import update_cached_chapter, update_cached_chapters
 
 
 class QtConsumer(AsyncWebsocketConsumer):
@@ -36,7 +37,8 @@ class QtConsumer(AsyncWebsocketConsumer):
             event (dict): The event data containing the text_data to be sent.
         """
         to_translate = event["to_translate"]
-        await self.send(json.dumps(to_translate))
+        # Chapter indices are int keys; stringify them like json.dumps did
+        await self.send(orjson.dumps(to_translate, option=orjson.OPT_NON_STR_KEYS).decode())
 
     async def receive(self, text_data):
         """
@@ -46,23 +48,20 @@ class QtConsumer(AsyncWebsocketConsumer):
         Args:
             text_data (str): JSON string containing the manhwa toonkor_id and chapter index.
         """
-        data = json.loads(text_data)
+        data = orjson.loads(text_data)
         toonkor_id = data["toonkor_id"]
         chapter = int(data["chapter"])
-        chapter_obj = await sync_to_async(Chapter.objects.get)(
-            manhwa_id=toonkor_id, index=chapter
+        await Chapter.objects.filter(manhwa_id=toonkor_id, index=chapter).aupdate(
+            translation_status=StatusChoices.READY
         )
-        chapter_obj.translation_status = StatusChoices.READY
-        await sync_to_async(chapter_obj.save)()
         update_cached_chapter(toonkor_id, chapter, 'translation_status', 'READY')
         group = f"download_translate_{encode_name(toonkor_id)}" 
         await self.channel_layer.group_send(
             group,
-            {
-                "type": "send_progress",
-                "chapters": [{"index": chapter, "status": "Translated"}],
-                "progress": data["progress"],
-            },
+            progress_event(
+                chapters=[{"index": chapter, "status": "Translated"}],
+                progress=data["progress"],
+            ),
         )
 
     async def disconnect(self, close_code):
@@ -105,7 +104,7 @@ class DownloadTranslateConsumer(AsyncWebsocketConsumer):
         Args:
             text_data (str): JSON string containing the task, manhwa toonkor_id, and chapters to download.
         """
-        data = json.loads(text_data)
+        data = orjson.loads(text_data)
         task = data["task"]
         chapters = data["chapters"]
         if task == "remove":
@@ -116,40 +115,44 @@ class DownloadTranslateConsumer(AsyncWebsocketConsumer):
 
     async def run_download_translate(self, task, chapters):
         progress = {"current": 0, "total": len(chapters)}
+        if task == 'download_translate':
+            loading_keys = ('download_status', 'translation_status')
+        else:
+            loading_keys = ('download_status',)
+
+        # One pass marks the chapters for the broadcast and collects the cache updates
+        updates = []
         for chapter in chapters:
-            chapter['download_status'] = 'LOADING'
-            update_cached_chapter(self.manhwa_id, chapter['index'], 'download_status', 'LOADING')
-            if task == 'download_translate':
-                chapter['translation_status'] = 'LOADING'
-                update_cached_chapter(self.manhwa_id, chapter['index'], 'translation_status', 'LOADING')
+            for key in loading_keys:
+                chapter[key] = 'LOADING'
+                updates.append((chapter['index'], key, 'LOADING'))
+        await sync_to_async(update_cached_chapters)(self.manhwa_id, updates)
+
+        # The set of chapters is fixed from here on; share one immutable sequence
+        chapters = tuple(chapters)
 
         await self.channel_layer.group_send(
             self.group_name,
-            {
-                "type": "send_progress",
-                "chapters": chapters,
-                "progress": progress,
-            }
+            progress_event(chapters=chapters, progress=progress),
         )
         downloader.append(self.manhwa_id, self.group_name, task, chapters)
 
     async def run_remove(self, chapters, remove_choices):
+        updates = []
         for chapter in chapters:
             if remove_choices["downloaded"]:
                 chapter['download_status'] = 'REMOVING'
-                update_cached_chapter(self.manhwa_id, chapter['index'], 'download_status', 'REMOVING')
+                updates.append((chapter['index'], 'download_status', 'REMOVING'))
 
             if remove_choices['translated']:
                 chapter['translation_status'] = 'REMOVING'        
-                update_cached_chapter(self.manhwa_id, chapter['index'], 'remove_status', 'REMOVING')
+                updates.append((chapter['index'], 'remove_status', 'REMOVING'))
+        await sync_to_async(update_cached_chapters)(self.manhwa_id, updates)
+        chapters = tuple(chapters)
 
         await self.channel_layer.group_send(
             self.group_name,
-            {
-                "type": "send_progress",
-                "chapters": chapters,
-                "progress": {},
-            }
+            progress_event(chapters=chapters, progress={}),
         )
         cleaner.append(self.manhwa_id, self.group_name, chapters, remove_choices)
 
@@ -158,9 +161,9 @@ class DownloadTranslateConsumer(AsyncWebsocketConsumer):
         Sends progress updates to the WebSocket client.
 
         Args:
-            event (dict): The event data containing progress information.
+            event (dict): The event built by progress_event, carrying the encoded frame.
         """
-        await self.send(text_data=json.dumps(event))
+        await self.send(text_data=event["text_data"])
 
     async def disconnect(self, close_code):
         """
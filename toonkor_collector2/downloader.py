@@ -5,6 +5,7 @@ from collections import deque
 from channels.layers import get_channel_layer
 from asgiref.sync import sync_to_async
 from toonkor_collector2.api import update_cached_chapter, start_comic_proc
+from toonkor_collector2.events import progress_event
 from toonkor_collector2.models import Chapter, StatusChoices
 from toonkor_collector2.toonkor_api import toonkor_api
 
@@ -56,7 +57,7 @@ class Downloader:
                         date_upload=chapter['date_upload']
                     )
                     chapter_obj.download_status = StatusChoices.READY
-                    await sync_to_async(chapter_obj.save)()
+                    await sync_to_async(chapter_obj.save)(update_fields=['download_status'])
 
                     chapter['download_status'] = 'READY'
                     update_cached_chapter(manhwa_id, chapter['index'], "download_status", 'READY')
@@ -79,21 +80,14 @@ class Downloader:
         """Send progress updates to the WebSocket group."""
         await self._channel_layer.group_send(
             group_name,
-            {
-                "type": "send_progress",
-                "chapters": chapters,
-                "progress": progress,
-            }
+            progress_event(chapters=chapters, progress=progress),
         )
 
     async def _send_error(self, group_name, error_message):
         """Send an error message to the WebSocket group."""
         await self._channel_layer.group_send(
             group_name,
-            {
-                "type": "send_progress",
-                "error": error_message,
-            }
+            progress_event(error=error_message),
         )
 
     async def _send_translation_request(self, download_dict):
@@ -0,0 +1,18 @@
+import orjson
+
+
+def progress_event(**payload) -> dict:
+    """
+    Builds a 'send_progress' channel event whose websocket frame is encoded once,
+    before the group fan-out, instead of once per subscribed consumer.
+
+    Args:
+        **payload: Frame fields, e.g. chapters and progress, or error.
+
+    Returns:
+        dict: The channel layer event carrying the pre-encoded frame in 'text_data'.
+    """
+    frame = {"type": "send_progress", **payload}
+    # Match json.dumps, which stringified any non-str keys
+    text_data = orjson.dumps(frame, option=orjson.OPT_NON_STR_KEYS).decode()
+    return {"type": "send_progress", "text_data": text_data}
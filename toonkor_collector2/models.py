@@ -2,9 +2,10 @@ import base64
 import os
 
 from django.db import models
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 
+@lru_cache(maxsize=1024)
 def encode_name(name: str):
     return base64.urlsafe_b64encode(name.encode()).decode().rstrip("=")
 